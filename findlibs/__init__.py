@@ -8,7 +8,7 @@
 # nor does it submit to any jurisdiction.
 #
 
-import ctypes.util
+import functools
 import os
 import sys
 
@@ -19,12 +19,51 @@ EXTENSIONS = {
     "win32": ".dll",
 }
 
+_EXTENSION = EXTENSIONS.get(sys.platform, ".so")
+
+_SYS_ROOTS = ("/", "/usr/", "/usr/local/", "/opt/", "/opt/homebrew/")
+
+_LIB_SUBDIRS = ("lib", "lib64")
+
+_SYS_LIBDIRS = tuple(
+    os.path.join(root, lib) for root in _SYS_ROOTS for lib in _LIB_SUBDIRS
+)
+
+# HOME is part of the key as *_HOME/*_DIR values may start with "~".
+_ENV_CACHE_VARS = ("CONDA_PREFIX", "LD_LIBRARY_PATH", "DYLD_LIBRARY_PATH", "HOME")
+
+# ABI tags that `ldconfig -p` prints after "libc6," for libraries the running
+# interpreter can load, keyed by machine and word size ("" means no tag).
+# Machines not listed here, including those whose tag only gives the float ABI
+# (riscv64, loongarch64), skip the ldconfig lookup and rely on ctypes.util.
+_LDCONFIG_ABI_TAGS = {
+    "x86_64-64": ("x86-64",),
+    "aarch64-64": ("AArch64",),
+    "ia64-64": ("IA-64",),
+    "ppc64-64": ("64bit",),
+    "ppc64le-64": ("64bit",),
+    "s390x-64": ("64bit",),
+    "sparc64-64": ("64bit",),
+    "i386-32": ("",),
+    "i486-32": ("",),
+    "i586-32": ("",),
+    "i686-32": ("",),
+}
+
 
 def find(lib_name, pkg_name=None):
     """Returns the path to the selected library, or None if not found.
 
+    Results are cached per library and environment. The directory listings
+    they are based on are cached separately, regardless of the environment,
+    and may be re-read at any time, so a library installed while the process
+    is running may or may not be seen. Call `find.cache_clear()` to force a
+    new search.
+
     Args:
-        lib_name (str): Library name without the `lib` prefix
+        lib_name (str): Library name without the `lib` prefix. A file name such
+            as `libfoo.so`, or the absolute path of an existing file, is also
+            accepted.
         pkg_name (str, optional): Package name if it differs from the library name.
             Defaults to None.
 
@@ -32,49 +71,217 @@ def find(lib_name, pkg_name=None):
         str | None: Path to selected library
     """
 
+    if os.path.isabs(lib_name) and os.path.isfile(lib_name):
+        return lib_name
+
+    if lib_name.startswith("lib") and lib_name.endswith(_EXTENSION):
+        lib_name = lib_name[len("lib") : -len(_EXTENSION)]
+
     pkg_name = pkg_name or lib_name
-    extension = EXTENSIONS.get(sys.platform, ".so")
+
+    envs = _home_envs(pkg_name) + _ENV_CACHE_VARS
+    env_key = (sys.prefix,) + tuple(os.environ.get(env) for env in envs)
+
+    return _find_impl(lib_name, pkg_name, env_key)
+
+
+def find_many(lib_names, pkg_names=None):
+    """Returns the paths to several libraries at once.
+
+    Directory listings are shared between the lookups, so each candidate
+    directory is read at most once for the whole batch.
+
+    Args:
+        lib_names (list[str]): Library names without the `lib` prefix
+        pkg_names (dict[str, str], optional): Package names of the libraries
+            whose package name differs from the library name. Defaults to None.
+
+    Returns:
+        dict[str, str | None]: Path to each selected library, keyed by name
+    """
+
+    pkg_names = pkg_names or {}
+    return {
+        lib_name: find(lib_name, pkg_names.get(lib_name)) for lib_name in lib_names
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _find_impl(lib_name, pkg_name, env_key):
+    # env_key is only used to key the cache: it captures everything in the
+    # environment that can change the outcome of the search below.
+
+    libname = "lib{}{}".format(lib_name, _EXTENSION)
 
     # sys.prefix/lib, $CONDA_PREFIX/lib has highest priority;
     # otherwise, system library may mess up anaconda's virtual environment.
 
     roots = [sys.prefix]
-    if "CONDA_PREFIX" in os.environ:
-        roots.append(os.environ["CONDA_PREFIX"])
+    conda_prefix = os.environ.get("CONDA_PREFIX")
+    if conda_prefix is not None:
+        roots.append(conda_prefix)
 
     for root in roots:
-        for lib in ("lib", "lib64"):
-            fullname = os.path.join(root, lib, "lib{}{}".format(lib_name, extension))
-            if os.path.exists(fullname):
+        for lib in _LIB_SUBDIRS:
+            fullname = _find_in_dir(os.path.join(root, lib), libname)
+            if fullname is not None:
                 return fullname
 
-    env_prefixes = [pkg_name.upper(), pkg_name.lower()]
-    env_suffixes = ["HOME", "DIR"]
-    envs = ["{}_{}".format(x, y) for x in env_prefixes for y in env_suffixes]
-
-    for env in envs:
-        if env in os.environ:
-            home = os.path.expanduser(os.environ[env])
-            for lib in ("lib", "lib64"):
-                fullname = os.path.join(
-                    home, lib, "lib{}{}".format(lib_name, extension)
-                )
-                if os.path.exists(fullname):
-                    return fullname
-
-    for path in (
-        "LD_LIBRARY_PATH",
-        "DYLD_LIBRARY_PATH",
-    ):
-        for home in os.environ.get(path, "").split(":"):
-            fullname = os.path.join(home, "lib{}{}".format(lib_name, extension))
-            if os.path.exists(fullname):
+    for env in _home_envs(pkg_name):
+        home = os.environ.get(env)
+        if home is None:
+            continue
+        home = os.path.expanduser(home)
+        for lib in _LIB_SUBDIRS:
+            fullname = _find_in_dir(os.path.join(home, lib), libname)
+            if fullname is not None:
                 return fullname
 
-    for root in ("/", "/usr/", "/usr/local/", "/opt/", "/opt/homebrew/"):
-        for lib in ("lib", "lib64"):
-            fullname = os.path.join(root, lib, "lib{}{}".format(lib_name, extension))
-            if os.path.exists(fullname):
+    ld_dirs = _split_ld_paths(
+        os.environ.get("LD_LIBRARY_PATH", ""),
+        os.environ.get("DYLD_LIBRARY_PATH", ""),
+    )
+
+    for fullname in _lib_index(ld_dirs).get(libname, ()):
+        if os.path.exists(fullname):
+            return fullname
+
+    # A versioned copy such as libfoo.so.1 in a library path directory is
+    # left to ctypes.util, whose soname lets the loader honour the library
+    # path; a path from the ldconfig cache would bypass it.
+    versioned = libname + "."
+    shadowed = any(
+        name.startswith(versioned)
+        for dirname in ld_dirs
+        for name in _dir_names_cached(dirname)
+    )
+
+    if sys.platform.startswith("linux") and not shadowed:
+        ldconfig = _ldconfig_cache()
+        candidates = [ldconfig.get(libname)]
+        # Like ctypes.util.find_library, settle for a versioned soname, but
+        # without running ldconfig a second time.
+        candidates += [
+            fullname
+            for name, fullname in ldconfig.items()
+            if name.startswith(versioned)
+        ]
+        for fullname in candidates:
+            if fullname is not None and os.path.exists(fullname):
                 return fullname
 
+    # Imported here as most lookups never get this far, and ctypes.util
+    # pulls in a good part of the standard library on import.
+    import ctypes.util
+
     return ctypes.util.find_library(lib_name)
+
+
+@functools.lru_cache(maxsize=256)
+def _home_envs(pkg_name):
+    env_prefixes = [pkg_name.upper(), pkg_name.lower()]
+    env_suffixes = ["HOME", "DIR"]
+    return tuple("{}_{}".format(x, y) for x in env_prefixes for y in env_suffixes)
+
+
+def _find_in_dir(dirname, libname):
+    # The listing rules out most directories without a stat() call, but a
+    # matching entry may be a dangling symlink, so a hit is confirmed.
+    if libname in _dir_names_cached(dirname):
+        fullname = os.path.join(dirname, libname)
+        if os.path.exists(fullname):
+            return fullname
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _dir_names_cached(path):
+    # One directory read answers the question for every library looked up
+    # in that directory, including the negative answers.
+    try:
+        with os.scandir(path) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+
+
+@functools.lru_cache(maxsize=4)
+def _split_ld_paths(*paths):
+    # Shell start-up files often prepend the same entries several times;
+    # only the first occurrence of each directory can match.
+    return tuple(
+        dict.fromkeys(
+            home for path in paths for home in path.split(os.pathsep) if home
+        )
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _lib_index(ld_dirs):
+    # Maps every library file name found in the library path directories,
+    # then in the system roots, to the paths it was found at, in search
+    # order. Libraries that are not in sys.prefix, $CONDA_PREFIX or a
+    # *_HOME/*_DIR directory are then resolved with a single dictionary
+    # lookup; callers still check each path, as it may be a dangling link.
+    index = {}
+    for dirname in ld_dirs + _SYS_LIBDIRS:
+        for name in _dir_names_cached(dirname):
+            if name.endswith(_EXTENSION):
+                index.setdefault(name, []).append(os.path.join(dirname, name))
+
+    return index
+
+
+@functools.lru_cache(maxsize=1)
+def _ldconfig_cache():
+    # Maps the file names in the dynamic linker cache to their paths, keeping
+    # only the entries built for the ABI of the running interpreter.
+    import subprocess
+
+    libs = {}
+
+    machine = "{}-{}".format(os.uname().machine, 64 if sys.maxsize > 2**32 else 32)
+    abi_tags = _LDCONFIG_ABI_TAGS.get(machine)
+    if abi_tags is None:
+        return libs
+
+    try:
+        with subprocess.Popen(
+            ("/sbin/ldconfig", "-p"),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env={"LC_ALL": "C", "LANG": "C"},
+        ) as p:
+            output = os.fsdecode(p.stdout.read())
+    except OSError:
+        return libs
+
+    # Lines look like: "libz.so.1 (libc6,x86-64) => /lib64/libz.so.1", where
+    # the flags may go on with ", hwcap: ..." or ", OS ABI: ..." entries.
+    for line in output.splitlines():
+        entry, sep, fullname = line.partition(" => ")
+        if not sep:
+            continue
+        name, _, flags = entry.strip().partition(" ")
+        flags = flags.strip("()").split(",")
+        if flags[0] != "libc6":
+            continue
+        tag = flags[1].strip() if len(flags) > 1 else ""
+        if ":" in tag:
+            tag = ""
+        if tag in abi_tags:
+            libs.setdefault(name, fullname.strip())
+
+    return libs
+
+
+def _cache_clear():
+    _find_impl.cache_clear()
+    _dir_names_cached.cache_clear()
+    _split_ld_paths.cache_clear()
+    _lib_index.cache_clear()
+    _ldconfig_cache.cache_clear()
+
+
+find.cache_clear = _cache_clear